@@ -0,0 +1,28 @@
+"""
+Request rate limiting shared by the migration scripts.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` requests per second across all threads."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.allowance = rate
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.allowance = min(self.rate, self.allowance + (now - self.last) * self.rate)
+            self.last = now
+            if self.allowance < 1:
+                time.sleep((1 - self.allowance) / self.rate)
+                self.last = time.monotonic()
+                self.allowance = 0
+            else:
+                self.allowance -= 1
@@ -3,26 +3,43 @@
 Import featured images from botschaftangola.de WordPress to WN MinIO + DB.
 
 Requires: pip install requests minio psycopg2-binary Pillow
+  (pillow-simd is a drop-in replacement for Pillow with SIMD resize kernels)
+Optional: pip install pyvips (needs libvips) to resize with libvips
 
 Usage:
   python wp_import_images.py                # Full import
   python wp_import_images.py --dry-run      # Preview only
   python wp_import_images.py --limit 10     # Import first 10 only
+  python wp_import_images.py --retry-failed # Also retry previously failed articles
+  python wp_import_images.py --recheck-skipped  # Re-query articles skipped for lack of an image
+  python wp_import_images.py --cache        # Keep originals in media_cache/
 """
 
 import argparse
+import hashlib
 import io
 import json
 import os
 import sys
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from urllib.parse import urlparse
 
 import requests
-from PIL import Image
+from PIL import Image, ImageOps
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ratelimit import RateLimiter
+
+try:
+    import pyvips  # Optional: libvips shrink-on-load resize, faster and leaner than Pillow
+except (ImportError, OSError):
+    pyvips = None
 
 # ── Configuration ─────────────────────────────────────────────────────────────
 
@@ -38,24 +55,82 @@ MINIO_ENDPOINT = os.getenv("MINIO_ENDPOINT", "localhost:9000")
 MINIO_ACCESS_KEY = os.getenv("MINIO_ACCESS_KEY", "minio_admin")
 MINIO_SECRET_KEY = os.getenv("MINIO_SECRET_KEY", "minio_dev_2026")
 MINIO_BUCKET = "wn-media"
+MINIO_PART_SIZE = 5 * 1024 * 1024  # Objects up to this size go up in one PUT
 
 MEDIA_DIR = Path(__file__).parent / "media_cache"
 STATE_FILE = Path(__file__).parent / "wp_images_state.json"
 
 MAX_WIDTH = 1200
 MAX_HEIGHT = 800
+JPEG_QUALITY = 85
+PROGRESSIVE_MIN_PIXELS = 60_000  # Below ~10kB, progressive scans cost more than they save
+OPTIMIZE_MIN_PIXELS = 250_000    # Below ~50kB, the extra Huffman pass is not worth the CPU
+
+WORKERS = 5  # Concurrent articles in flight against WordPress
+UPLOAD_WORKERS = 8  # Concurrent MinIO uploads
+UPLOAD_RETRIES = 3
+WP_BATCH_SIZE = 50   # Slugs per WordPress /posts request; keeps the URL under 8 KB
+DB_BATCH_SIZE = 50   # Uploaded images per DB commit
+WP_REQUESTS_PER_SECOND = 5  # Politeness cap shared by all workers
+
+# Shared HTTP session: keep-alive connections to WordPress are reused across
+# articles instead of paying a TCP + TLS handshake per request.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "wn-import/1.0"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
+
+
+WP_RATE_LIMITER = RateLimiter(WP_REQUESTS_PER_SECOND)
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 
+_saved_fingerprint = None  # Fingerprint of the state as last loaded/written
+
+
+def _state_fingerprint(state):
+    return hash((
+        frozenset(state["imported"].items()),
+        frozenset(state["failed"]),
+        frozenset((slug, entry["reason"], entry.get("ts")) for slug, entry in state["skipped"].items()),
+    ))
+
+
 def load_state():
-    if STATE_FILE.exists():
-        return json.loads(STATE_FILE.read_text())
-    return {"imported": {}, "failed": [], "skipped": []}
+    global _saved_fingerprint
+    raw = json.loads(STATE_FILE.read_text()) if STATE_FILE.exists() else {}
+    skipped = raw.get("skipped", {})
+    if isinstance(skipped, list):  # State files from before skip reasons were kept
+        skipped = {slug: {"reason": "unknown"} for slug in skipped}
+    state = {
+        "imported": dict(raw.get("imported", {})),
+        "failed": set(raw.get("failed", [])),
+        "skipped": skipped,
+    }
+    _saved_fingerprint = _state_fingerprint(state)
+    return state
 
 
 def save_state(state):
-    STATE_FILE.write_text(json.dumps(state, indent=2, ensure_ascii=False))
+    """Write state atomically (temp file + rename), skipping unchanged state."""
+    global _saved_fingerprint
+    fingerprint = _state_fingerprint(state)
+    if fingerprint == _saved_fingerprint:
+        return
+
+    data = {
+        "imported": state["imported"],
+        "failed": sorted(state["failed"]),
+        "skipped": dict(sorted(state["skipped"].items())),
+    }
+    tmp = STATE_FILE.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+    os.replace(tmp, STATE_FILE)
+    _saved_fingerprint = fingerprint
 
 
 def get_db_connection():
@@ -76,102 +151,188 @@ def get_minio_client():
     )
 
 
-def fetch_articles_without_images(conn):
-    """Get all articles without featured images."""
-    cur = conn.cursor()
-    cur.execute("""
+def fetch_articles_without_images(conn, limit=None):
+    """Yield articles without featured images (newest first, up to limit).
+
+    Rows stream through a server-side cursor, so pass a dedicated read-only
+    connection: a commit on the same connection would close the cursor.
+    """
+    sql = """
         SELECT id, slug, titulo_pt
         FROM articles
         WHERE featured_image_id IS NULL
           AND estado = 'PUBLISHED'
         ORDER BY published_at DESC
-    """)
-    rows = cur.fetchall()
-    cur.close()
-    return [{"id": str(r[0]), "slug": r[1], "title": r[2]} for r in rows]
-
+    """
+    params = ()
+    if limit:
+        sql += " LIMIT %s"
+        params = (limit,)
+
+    with conn.cursor(name="articles_missing_img") as cur:
+        cur.itersize = 500
+        cur.execute(sql, params)
+        for r in cur:
+            yield {"id": str(r[0]), "slug": r[1], "title": r[2]}
+
+
+def chunked(iterable, size):
+    """Yield lists of up to size items (itertools.batched needs Python 3.12)."""
+    it = iter(iterable)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def featured_media_info(post):
+    """Extract featured image URL and metadata from an embedded WP post."""
+    embedded = post.get("_embedded", {})
+    media_list = embedded.get("wp:featuredmedia", [])
+    if not media_list:
+        return None
 
-def fetch_wp_featured_image(slug):
-    """Get featured image URL and metadata from WordPress."""
-    try:
-        resp = requests.get(
-            f"{WP_BASE}/posts",
-            params={"slug": slug, "_embed": "true"},
-            timeout=30
-        )
-        if resp.status_code != 200 or not resp.json():
-            return None
-
-        post = resp.json()[0]
-        embedded = post.get("_embedded", {})
-        media_list = embedded.get("wp:featuredmedia", [])
-        if not media_list:
-            return None
-
-        media = media_list[0]
-        source_url = media.get("source_url")
-        if not source_url:
-            return None
-
-        # Get best size (prefer medium_large for reasonable quality/size)
-        sizes = media.get("media_details", {}).get("sizes", {})
-        best_url = source_url  # fallback to full
-        for size_key in ["medium_large", "large", "full"]:
-            if size_key in sizes:
-                best_url = sizes[size_key].get("source_url", best_url)
-                break
-
-        return {
-            "url": best_url,
-            "mime_type": media.get("mime_type", "image/jpeg"),
-            "alt_text": media.get("alt_text", ""),
-            "width": media.get("media_details", {}).get("width"),
-            "height": media.get("media_details", {}).get("height"),
-        }
-    except Exception as e:
-        print(f"  WordPress API error: {e}")
+    media = media_list[0]
+    source_url = media.get("source_url")
+    if not source_url:
         return None
 
+    # Get best size (prefer medium_large for reasonable quality/size)
+    sizes = media.get("media_details", {}).get("sizes", {})
+    best_url = source_url  # fallback to full
+    for size_key in ["medium_large", "large", "full"]:
+        if size_key in sizes:
+            best_url = sizes[size_key].get("source_url", best_url)
+            break
+
+    return {
+        "url": best_url,
+        "mime_type": media.get("mime_type", "image/jpeg"),
+        "alt_text": media.get("alt_text", ""),
+        "width": media.get("media_details", {}).get("width"),
+        "height": media.get("media_details", {}).get("height"),
+    }
+
+
+def fetch_wp_batch(slugs, session=SESSION):
+    """Get featured image metadata for many slugs, WP_BATCH_SIZE per request.
+
+    Returns {slug: media_info}; media_info is {} for posts without a featured
+    image and None for slugs WordPress does not know. Slugs whose batch
+    request failed are left out of the result.
+
+    A batch rejected with 414 (URI too long) is split in half and retried.
+    """
+    result = {}
+    chunks = [slugs[start:start + WP_BATCH_SIZE] for start in range(0, len(slugs), WP_BATCH_SIZE)]
+    while chunks:
+        chunk = chunks.pop()
+        try:
+            WP_RATE_LIMITER.acquire()
+            resp = session.get(
+                f"{WP_BASE}/posts",
+                params={"slug": ",".join(chunk), "per_page": WP_BATCH_SIZE, "_embed": "true"},
+                timeout=30
+            )
+            if resp.status_code == 414 and len(chunk) > 1:
+                half = len(chunk) // 2
+                chunks += [chunk[half:], chunk[:half]]
+                continue
+            resp.raise_for_status()
+            posts = resp.json()
+        except Exception as e:
+            print(f"  WordPress API error: {e}")
+            continue
 
-def download_image(url, slug):
-    """Download image to local cache. Returns path or None."""
-    MEDIA_DIR.mkdir(exist_ok=True)
+        result.update(dict.fromkeys(chunk))
+        for post in posts:
+            if post.get("slug") in result:
+                result[post["slug"]] = featured_media_info(post) or {}
+    return result
 
-    ext = Path(urlparse(url).path).suffix or ".jpg"
-    cache_path = MEDIA_DIR / f"{slug}{ext}"
 
-    if cache_path.exists() and cache_path.stat().st_size > 0:
-        return cache_path
+def fetch_and_resize(url, slug, cache=False, quality=JPEG_QUALITY, session=SESSION):
+    """Download an image and resize it in memory, return bytes + dimensions.
 
-    try:
-        resp = requests.get(url, timeout=60, stream=True)
-        resp.raise_for_status()
-        with open(cache_path, "wb") as f:
-            for chunk in resp.iter_content(8192):
-                f.write(chunk)
-        return cache_path
-    except Exception as e:
-        print(f"  Download error: {e}")
-        cache_path.unlink(missing_ok=True)
-        return None
+    The response body is resized straight from memory; with cache=True the
+    original is also kept in MEDIA_DIR and reused on later runs.
+    """
+    cache_path = None
+    if cache:
+        MEDIA_DIR.mkdir(exist_ok=True)
+        ext = Path(urlparse(url).path).suffix or ".jpg"
+        cache_path = MEDIA_DIR / f"{slug}{ext}"
+
+    if cache_path and cache_path.exists() and cache_path.stat().st_size > 0:
+        data = cache_path.read_bytes()
+    else:
+        try:
+            WP_RATE_LIMITER.acquire()
+            resp = session.get(url, timeout=60)
+            resp.raise_for_status()
+            data = resp.content
+        except Exception as e:
+            print(f"  Download error: {e}")
+            return None, 0, 0
+        if cache_path:
+            cache_path.write_bytes(data)
+
+    return resize_image(data, quality)
 
 
-def resize_image(file_path):
-    """Resize image to max dimensions, return bytes + dimensions."""
+def resize_image(data, quality=JPEG_QUALITY):
+    """Resize image to max dimensions, return bytes + dimensions.
+
+    Uses libvips when pyvips is installed, falling back to Pillow when it is
+    not or when libvips cannot load the format.
+    """
+    if pyvips is not None:
+        try:
+            return resize_image_vips(data, quality)
+        except pyvips.Error as e:
+            print(f"  libvips resize failed, using Pillow: {e}")
+    return resize_image_pillow(data, quality)
+
+
+def resize_image_vips(data, quality=JPEG_QUALITY):
+    """Resize with libvips: JPEGs are shrunk on load instead of fully decoded."""
+    image = pyvips.Image.thumbnail_buffer(data, MAX_WIDTH, height=MAX_HEIGHT, size="down")
+    if image.hasalpha():
+        image = image.flatten()
+    if image.interpretation != "srgb":
+        image = image.colourspace("srgb")
+
+    pixels = image.width * image.height
+    out = image.jpegsave_buffer(Q=quality, optimize_coding=pixels >= OPTIMIZE_MIN_PIXELS,
+                                interlace=pixels >= PROGRESSIVE_MIN_PIXELS,
+                                subsample_mode="on", strip=True)
+    return io.BytesIO(out), image.width, image.height
+
+
+def resize_image_pillow(data, quality=JPEG_QUALITY):
+    """Resize with Pillow."""
     try:
-        img = Image.open(file_path)
-        img = img.convert("RGB")
-
-        w, h = img.size
-        if w > MAX_WIDTH or h > MAX_HEIGHT:
-            ratio = min(MAX_WIDTH / w, MAX_HEIGHT / h)
-            new_w, new_h = int(w * ratio), int(h * ratio)
-            img = img.resize((new_w, new_h), Image.LANCZOS)
-        else:
-            new_w, new_h = w, h
+        img = Image.open(io.BytesIO(data))
+        # Let libjpeg decode large JPEGs at a reduced DCT scale (no-op for other formats)
+        img.draft("RGB", (MAX_WIDTH * 2, MAX_HEIGHT * 2))
+        # Apply the EXIF orientation (e.g. portrait phone shots) before resizing.
+        # Transposing in place and converting only non-RGB sources avoids
+        # holding a second full-size copy next to the decoded original.
+        ImageOps.exif_transpose(img, in_place=True)
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        img.thumbnail((MAX_WIDTH, MAX_HEIGHT), Image.LANCZOS, reducing_gap=3.0)
+        new_w, new_h = img.size
+
+        # Drop EXIF/ICC/comment metadata so it is never carried into the output
+        for key in ("exif", "icc_profile", "comment"):
+            img.info.pop(key, None)
 
         buf = io.BytesIO()
-        img.save(buf, format="JPEG", quality=85, optimize=True)
+        pixels = new_w * new_h
+        img.save(buf, format="JPEG", quality=quality,
+                 optimize=pixels >= OPTIMIZE_MIN_PIXELS,
+                 progressive=pixels >= PROGRESSIVE_MIN_PIXELS,
+                 subsampling=2,  # 4:2:0
+                 exif=b"", icc_profile=None)
         buf.seek(0)
         return buf, new_w, new_h
     except Exception as e:
@@ -179,142 +340,354 @@ def resize_image(file_path):
         return None, 0, 0
 
 
-def upload_to_minio(client, image_buf, object_key, size):
-    """Upload image bytes to MinIO."""
-    # Ensure bucket exists
-    if not client.bucket_exists(MINIO_BUCKET):
-        client.make_bucket(MINIO_BUCKET)
+def upload_to_minio(client, data, object_key):
+    """Upload image bytes to MinIO (the bucket is created once in main()).
 
-    client.put_object(
-        MINIO_BUCKET,
-        object_key,
-        image_buf,
-        length=size,
-        content_type="image/jpeg"
-    )
+    Images are well under MINIO_PART_SIZE, so the SDK sends a single PUT
+    rather than a multipart upload. Transient failures are retried with
+    exponential backoff (0.5s, 1s, ...).
+    """
+    for attempt in range(UPLOAD_RETRIES):
+        try:
+            client.put_object(
+                MINIO_BUCKET,
+                object_key,
+                io.BytesIO(data),
+                length=len(data),
+                part_size=MINIO_PART_SIZE,
+                content_type="image/jpeg"
+            )
+            return
+        except Exception:
+            if attempt == UPLOAD_RETRIES - 1:
+                raise
+            time.sleep(0.5 * 2 ** attempt)
+
+
+def ensure_content_hash_column(conn):
+    """Add media_files.content_hash (+ unique index) used to deduplicate uploads."""
+    cur = conn.cursor()
+    cur.execute("ALTER TABLE media_files ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)")
+    cur.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS media_files_content_hash_key
+        ON media_files (content_hash)
+    """)
+    cur.close()
+    conn.commit()
 
 
-def insert_media_record(conn, media_id, file_name, object_key, size, width, height, alt_text):
-    """Insert media_files record and return the id."""
+def find_media_by_hash(conn, content_hash):
+    """Return the id of an existing media_files row with these exact bytes."""
+    cur = conn.cursor()
+    cur.execute("SELECT id FROM media_files WHERE content_hash = %s LIMIT 1", (content_hash,))
+    row = cur.fetchone()
+    cur.close()
+    return str(row[0]) if row else None
+
+
+def prepare_statements(conn):
+    """PREPARE the per-row insert/update once per connection."""
     cur = conn.cursor()
     cur.execute("""
+        PREPARE ins_media AS
         INSERT INTO media_files (id, file_name, original_name, mime_type, size,
                                   bucket, object_key, alt_pt, width, height,
-                                  created_by, version)
-        VALUES (%s, %s, %s, 'image/jpeg', %s, %s, %s, %s, %s, %s, 'wp_import', 0)
-    """, (media_id, file_name, file_name, size, MINIO_BUCKET, object_key,
-          alt_text or None, width, height))
+                                  content_hash, created_by, version)
+        VALUES ($1, $2, $3, 'image/jpeg', $4, $5, $6, $7, $8, $9, $10, 'wp_import', 0)
+    """)
+    cur.execute("""
+        PREPARE link_img AS
+        UPDATE articles SET featured_image_id = $1 WHERE id = $2
+    """)
+    cur.close()
+    conn.commit()
+
+
+def insert_media_record(conn, media_id, file_name, object_key, size, width, height, alt_text,
+                        content_hash):
+    """Insert media_files record and return the id."""
+    cur = conn.cursor()
+    cur.execute(
+        "EXECUTE ins_media (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+        (media_id, file_name, file_name, size, MINIO_BUCKET, object_key,
+         alt_text or None, width, height, content_hash))
     cur.close()
 
 
 def link_article_image(conn, article_id, media_id):
     """Set article's featured_image_id."""
     cur = conn.cursor()
-    cur.execute("""
-        UPDATE articles SET featured_image_id = %s WHERE id = %s
-    """, (media_id, article_id))
+    cur.execute("EXECUTE link_img (%s, %s)", (media_id, article_id))
     cur.close()
 
 
+def write_db_batch(conn, batch):
+    """Insert media records and link articles for a batch in one commit.
+
+    batch is a list of (slug, article_id, upload_result); results marked
+    "existing" reuse a media record and only need the article link. Returns
+    the slugs that were written; if the batch fails it is retried row by row
+    so one bad record does not drop the rest.
+    """
+    from psycopg2.extras import execute_values
+
+    try:
+        cur = conn.cursor()
+        execute_values(cur, """
+            INSERT INTO media_files (id, file_name, original_name, mime_type, size,
+                                      bucket, object_key, alt_pt, width, height,
+                                      content_hash, created_by, version)
+            VALUES %s
+        """, [
+            (r["media_id"], r["file_name"], r["file_name"], r["size"], MINIO_BUCKET,
+             r["object_key"], r["alt_text"] or None, r["width"], r["height"], r["content_hash"])
+            for _, _, r in batch if not r.get("existing")
+        ], template="(%s, %s, %s, 'image/jpeg', %s, %s, %s, %s, %s, %s, %s, 'wp_import', 0)")
+        # Stage the links with COPY, then update articles in one statement
+        cur.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS media_updates (article_id UUID, media_id UUID)
+            ON COMMIT DELETE ROWS
+        """)
+        rows = "".join(f"{article_id}\t{r['media_id']}\n" for _, article_id, r in batch)
+        cur.copy_expert("COPY media_updates (article_id, media_id) FROM STDIN", io.StringIO(rows))
+        cur.execute("""
+            UPDATE articles AS a SET featured_image_id = m.media_id
+            FROM media_updates AS m
+            WHERE a.id = m.article_id
+        """)
+        cur.close()
+        conn.commit()
+        return [slug for slug, _, _ in batch]
+    except Exception as e:
+        conn.rollback()
+        print(f"  DB batch error, retrying row by row: {e}")
+
+    written = []
+    for slug, article_id, r in batch:
+        try:
+            if not r.get("existing"):
+                insert_media_record(conn, r["media_id"], r["file_name"], r["object_key"],
+                                    r["size"], r["width"], r["height"], r["alt_text"],
+                                    r["content_hash"])
+            link_article_image(conn, article_id, r["media_id"])
+            conn.commit()
+            written.append(slug)
+        except Exception as e:
+            conn.rollback()
+            print(f"  DB error ({slug}): {e}")
+    return written
+
+
+def prepare_image(art, wp_img, cache=False, quality=JPEG_QUALITY):
+    """Download and resize one article's image.
+
+    Runs in a worker thread; the MinIO upload and DB writes are driven from
+    the main thread, since a psycopg2 connection must not be shared across
+    threads.
+    """
+    # 2. Download + resize
+    image_buf, width, height = fetch_and_resize(wp_img["url"], art["slug"], cache=cache,
+                                                quality=quality)
+    if not image_buf:
+        return {"status": "failed"}
+
+    data = image_buf.getvalue()
+    media_id = str(uuid.uuid4())
+    file_name = f"{media_id}.jpg"
+    return {
+        "status": "resized",
+        "data": data,
+        "media_id": media_id,
+        "file_name": file_name,
+        "object_key": f"articles/{file_name}",
+        "size": len(data),
+        "content_hash": hashlib.sha256(data).hexdigest(),
+        "width": width,
+        "height": height,
+        "alt_text": wp_img.get("alt_text", ""),
+    }
+
+
+def collect_uploads(uploads, db_batch, state, wait=False):
+    """Move finished MinIO uploads into db_batch, return how many failed.
+
+    uploads maps upload futures to (slug, article_id, result); with wait=True
+    every outstanding upload is awaited, otherwise only finished ones are taken.
+    Articles that reuse an in-flight image (result["duplicates"]) follow the
+    upload they depend on.
+    """
+    done = list(as_completed(uploads)) if wait else [f for f in uploads if f.done()]
+    failed = 0
+    for future in done:
+        slug, article_id, result = uploads.pop(future)
+        result.pop("data")
+        duplicates = result.pop("duplicates", [])
+        try:
+            future.result()
+        except Exception as e:
+            print(f"  MinIO upload error ({slug}): {e}")
+            result["status"] = "failed"
+            for dup_slug, _, _ in [(slug, article_id, result)] + duplicates:
+                state["failed"].add(dup_slug)
+                failed += 1
+            continue
+        result["status"] = "uploaded"
+        db_batch.append((slug, article_id, result))
+        db_batch.extend(duplicates)
+    return failed
+
+
+def flush_db_batch(conn, db_batch, state):
+    """Write pending DB rows and record the outcome in state.
+
+    Returns (written, failed) counts and empties db_batch.
+    """
+    if not db_batch:
+        return 0, 0
+
+    media_ids = {slug: r["media_id"] for slug, _, r in db_batch}
+    written = set(write_db_batch(conn, db_batch))
+    for slug, media_id in media_ids.items():
+        if slug in written:
+            state["imported"][slug] = media_id
+            state["failed"].discard(slug)
+        else:
+            state["failed"].add(slug)
+    print(f"  DB: {len(written)}/{len(db_batch)} records written")
+    db_batch.clear()
+    save_state(state)
+    return len(written), len(media_ids) - len(written)
+
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 
 def main():
     parser = argparse.ArgumentParser(description="Import WP featured images to WN")
     parser.add_argument("--dry-run", action="store_true", help="Preview without writing")
     parser.add_argument("--limit", type=int, default=0, help="Max articles to process (0=all)")
+    parser.add_argument("--retry-failed", action="store_true", help="Retry articles that failed before")
+    parser.add_argument("--recheck-skipped", action="store_true",
+                        help="Look up articles previously found without a WordPress image again")
+    parser.add_argument("--quality", type=int, default=JPEG_QUALITY,
+                        help=f"JPEG quality for resized images (default {JPEG_QUALITY})")
+    parser.add_argument("--cache", action="store_true", help="Keep downloaded originals in media_cache/")
     args = parser.parse_args()
 
     state = load_state()
     conn = get_db_connection()
+    if not args.dry_run:
+        ensure_content_hash_column(conn)
+        prepare_statements(conn)
+    read_conn = get_db_connection()
+    read_conn.set_session(readonly=True)
     minio_client = None if args.dry_run else get_minio_client()
+    if minio_client and not minio_client.bucket_exists(MINIO_BUCKET):
+        minio_client.make_bucket(MINIO_BUCKET)
 
-    articles = fetch_articles_without_images(conn)
-    print(f"Found {len(articles)} articles without images")
-
-    if args.limit > 0:
-        articles = articles[:args.limit]
+    articles = fetch_articles_without_images(read_conn, limit=args.limit or None)
 
     imported = 0
     skipped = 0
     failed = 0
-
-    for i, art in enumerate(articles, 1):
-        slug = art["slug"]
-        title = art["title"][:60] if art["title"] else slug
-
-        # Skip if already processed
-        if slug in state["imported"]:
-            skipped += 1
-            continue
-
-        print(f"[{i}/{len(articles)}] {title}...")
-
-        # 1. Fetch from WordPress
-        wp_img = fetch_wp_featured_image(slug)
-        if not wp_img:
-            print(f"  No featured image in WordPress")
-            state["skipped"].append(slug)
-            skipped += 1
-            time.sleep(0.3)
-            continue
-
-        if args.dry_run:
-            print(f"  Would download: {wp_img['url']}")
-            imported += 1
-            continue
-
-        # 2. Download image
-        local_path = download_image(wp_img["url"], slug)
-        if not local_path:
-            state["failed"].append(slug)
-            failed += 1
-            continue
-
-        # 3. Resize
-        image_buf, width, height = resize_image(local_path)
-        if not image_buf:
-            state["failed"].append(slug)
-            failed += 1
-            continue
-
-        size = image_buf.getbuffer().nbytes
-        media_id = str(uuid.uuid4())
-        file_name = f"{media_id}.jpg"
-        object_key = f"articles/{file_name}"
-
-        # 4. Upload to MinIO
-        try:
-            upload_to_minio(minio_client, image_buf, object_key, size)
-        except Exception as e:
-            print(f"  MinIO upload error: {e}")
-            state["failed"].append(slug)
-            failed += 1
-            continue
-
-        # 5. Insert DB records
-        try:
-            insert_media_record(conn, media_id, file_name, object_key, size,
-                                width, height, wp_img.get("alt_text", ""))
-            link_article_image(conn, art["id"], media_id)
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            print(f"  DB error: {e}")
-            state["failed"].append(slug)
-            failed += 1
-            continue
-
-        state["imported"][slug] = media_id
-        imported += 1
-        print(f"  OK ({width}x{height}, {size // 1024}kB)")
-
-        # Save state periodically
-        if imported % 10 == 0:
-            save_state(state)
-
-        time.sleep(0.3)  # Be polite to WordPress
-
+    i = 0
+
+    db_batch = []
+    uploads = {}
+    known_hashes = {}  # content_hash -> result of the article that owns the media record
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool, \
+            ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as upload_pool:
+        for chunk in chunked(articles, WP_BATCH_SIZE):
+            # Skip if already processed, known to have no image, or previously
+            # failed (unless asked to re-check / retry)
+            pending = [
+                art for art in chunk
+                if art["slug"] not in state["imported"]
+                and (args.recheck_skipped or art["slug"] not in state["skipped"])
+                and (args.retry_failed or art["slug"] not in state["failed"])
+            ]
+            skipped += len(chunk) - len(pending)
+            if not pending:
+                continue
+
+            # 1. Fetch from WordPress in batches
+            print(f"Fetching WordPress metadata for {len(pending)} articles...")
+            wp_images = fetch_wp_batch([art["slug"] for art in pending])
+
+            to_import = []
+            for art in pending:
+                slug = art["slug"]
+                if slug not in wp_images:
+                    state["failed"].add(slug)
+                    failed += 1
+                elif not wp_images[slug]:
+                    reason = "not_found" if wp_images[slug] is None else "no_featured_media"
+                    print(f"  {slug}: {reason.replace('_', ' ')} in WordPress")
+                    state["skipped"][slug] = {
+                        "reason": reason,
+                        "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    }
+                    skipped += 1
+                elif args.dry_run:
+                    print(f"  {slug}: would download {wp_images[slug]['url']}")
+                    imported += 1
+                else:
+                    to_import.append(art)
+
+            futures = {
+                pool.submit(prepare_image, art, wp_images[art["slug"]],
+                            args.cache, args.quality): art
+                for art in to_import
+            }
+            for future in as_completed(futures):
+                art = futures[future]
+                slug = art["slug"]
+                title = art["title"][:60] if art["title"] else slug
+                i += 1
+                print(f"[{i}] {title}...")
+
+                result = future.result()
+                if result["status"] == "failed":
+                    state["failed"].add(slug)
+                    failed += 1
+                    continue
+
+                print(f"  Resized ({result['width']}x{result['height']}, {result['size'] // 1024}kB)")
+
+                # Reuse an identical image that is already (being) stored
+                content_hash = result["content_hash"]
+                original = known_hashes.get(content_hash)
+                if not original or original["status"] == "failed":
+                    existing_id = find_media_by_hash(conn, content_hash)
+                    original = {"status": "uploaded", "media_id": existing_id} if existing_id else None
+
+                if original:
+                    print(f"  Same image as media {original['media_id']}, linking only")
+                    link = (slug, art["id"], {"media_id": original["media_id"], "existing": True})
+                    if original["status"] == "uploaded":
+                        db_batch.append(link)
+                    else:
+                        original.setdefault("duplicates", []).append(link)
+                else:
+                    # 3. Upload to MinIO in the background
+                    upload = upload_pool.submit(upload_to_minio, minio_client, result["data"],
+                                                result["object_key"])
+                    uploads[upload] = (slug, art["id"], result)
+                    known_hashes[content_hash] = result
+                failed += collect_uploads(uploads, db_batch, state)
+
+                # 4. Insert DB records in batches
+                if len(db_batch) >= DB_BATCH_SIZE:
+                    written, lost = flush_db_batch(conn, db_batch, state)
+                    imported += written
+                    failed += lost
+
+        failed += collect_uploads(uploads, db_batch, state, wait=True)
+
+    written, lost = flush_db_batch(conn, db_batch, state)
+    imported += written
+    failed += lost
     save_state(state)
+    read_conn.close()
     conn.close()
 
     print(f"\nDone: {imported} imported, {skipped} skipped, {failed} failed")
@@ -7,7 +7,7 @@ Migrates content from botschaftangola.de (WordPress) to:
   - WN Backend (Welwitschia Noticias): articles, categories, media
 
 Requirements:
-  pip install requests beautifulsoup4 Pillow
+  pip install requests lxml orjson Pillow
 
 Usage:
   python wp_migrate.py                      # Full migration
@@ -16,18 +16,28 @@ Usage:
 """
 
 import argparse
-import json
+import hashlib
+import html
+import logging
 import os
 import re
+import shutil
 import sys
 import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
+from functools import cache, lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
+import lxml.html
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ratelimit import RateLimiter
 
 # ── Configuration ────────────────────────────────────────────────────────────
 
@@ -44,6 +54,58 @@ WN_BACKEND = os.getenv("WN_BACKEND", "http://localhost:8083")
 
 MEDIA_DIR = Path(__file__).parent / "media_cache"
 STATE_FILE = Path(__file__).parent / "migration_state.json"
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+WP_CACHE_DIR = MEDIA_DIR.parent / "wp_cache"
+WP_CACHE_TTL = 24 * 3600  # Seconds a cached WP listing page stays fresh
+
+WP_PER_PAGE = 100
+WP_FETCH_WORKERS = 8        # Concurrent page requests against botschaftangola.de
+MEDIA_DOWNLOAD_WORKERS = 6  # Concurrent media downloads from WordPress
+MEDIA_UPLOAD_WORKERS = 8    # Concurrent media uploads to the SI/WN backends
+SI_SETUP_WORKERS = 5        # Concurrent contact/page creation requests
+SI_REQUESTS_PER_SECOND = 5  # Cap on SI backend calls, shared by all threads
+SAVE_INTERVAL = 2.0         # Seconds between state file writes inside a step
+
+log = logging.getLogger("wp_migrate")
+
+
+class BackendRetry(Retry):
+    """Retry policy that never replays a write the server may have applied.
+
+    GETs are retried on every status in status_forcelist and on read errors.
+    POST/PATCH stay out of allowed_methods, so a read timeout or dropped
+    connection after the body was sent raises instead of creating a
+    duplicate; they are only resent on 429/503, where the request was
+    refused before being processed.
+    """
+
+    UNPROCESSED_STATUSES = frozenset({429, 503})
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() in ("POST", "PATCH"):
+            return status_code in self.UNPROCESSED_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+# One session for WordPress, Keycloak and both backends, sized for the
+# download + upload pools of the media step. Failed requests are retried
+# with backoff as far as BackendRetry allows; once retries run out the
+# last response is returned to the caller.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "wp-migrate/1.0"})
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=BackendRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
 
 # ── WP Category → WN Category mapping ───────────────────────────────────────
 
@@ -88,6 +150,108 @@ WP_PAGE_MAP = {
 }
 
 
+# SI contact entries (Step 7)
+SI_CONTACTS = (
+    {
+        "departamento": "Embaixada da República de Angola",
+        "endereco": "Wallstraße 58",
+        "cidade": "Berlin",
+        "codigoPostal": "10179",
+        "pais": "Deutschland",
+        "telefone": "+49 30 240 897 0",
+        "fax": "+49 30 240 897 12",
+        "email": "info@botschaftangola.de",
+        "horarioPt": "Segunda a Sexta: 09:00 - 17:00",
+        "horarioEn": "Monday to Friday: 09:00 - 17:00",
+        "horarioDe": "Montag bis Freitag: 09:00 - 17:00",
+        "latitude": 52.5128,
+        "longitude": 13.4125,
+        "sortOrder": 0,
+    },
+    {
+        "departamento": "Secção Consular",
+        "endereco": "Wallstraße 58",
+        "cidade": "Berlin",
+        "codigoPostal": "10179",
+        "pais": "Deutschland",
+        "telefone": "+49 30 240 897 18",
+        "email": "konsulat@botschaftangola.de",
+        "horarioPt": "Segunda a Sexta: 09:00 - 13:00 (Atendimento ao público)",
+        "horarioEn": "Monday to Friday: 09:00 - 13:00 (Public hours)",
+        "horarioDe": "Montag bis Freitag: 09:00 - 13:00 (Publikumsverkehr)",
+        "latitude": 52.5128,
+        "longitude": 13.4125,
+        "sortOrder": 1,
+    },
+    {
+        "departamento": "Secção Consular - Praga (República Checa)",
+        "endereco": "Represented from Berlin",
+        "cidade": "Praha",
+        "pais": "Česká republika",
+        "telefone": "+49 30 240 897 0",
+        "email": "info@botschaftangola.de",
+        "horarioPt": "Atendimento mediante marcação prévia",
+        "horarioEn": "By appointment only",
+        "horarioDe": "Nur nach Terminvereinbarung",
+        "sortOrder": 2,
+    },
+)
+
+# SI pages with no WordPress counterpart (Step 8). The body of each
+# translation lives in templates/<slug>.<idioma>.html and is only read when
+# the page is actually created.
+SI_ADDITIONAL_PAGES = (
+    {
+        "slug": "sobre-angola",
+        "tipo": "INSTITUTIONAL",
+        "sortOrder": 0,
+        "translations": [{
+            "idioma": "PT",
+            "titulo": "Sobre Angola",
+            "excerto": "Informações gerais sobre a República de Angola",
+            "metaTitulo": "Sobre Angola - Embaixada de Angola na Alemanha",
+        }],
+    },
+    {
+        "slug": "embaixador",
+        "tipo": "INSTITUTIONAL",
+        "sortOrder": 0,
+        "translations": [{
+            "idioma": "PT",
+            "titulo": "O Embaixador",
+            "excerto": "Perfil do Embaixador de Angola na Alemanha",
+            "metaTitulo": "Embaixador - Embaixada de Angola na Alemanha",
+        }],
+    },
+    {
+        "slug": "relacoes-bilaterais",
+        "tipo": "INSTITUTIONAL",
+        "sortOrder": 0,
+        "translations": [{
+            "idioma": "PT",
+            "titulo": "Relações Bilaterais Angola-Alemanha",
+            "excerto": "Relações bilaterais entre Angola e a Alemanha",
+            "metaTitulo": "Relações Bilaterais - Embaixada de Angola na Alemanha",
+        }],
+    },
+    {
+        "slug": "servicos-consulares",
+        "tipo": "SERVICE",
+        "sortOrder": 0,
+        "translations": [{
+            "idioma": "PT",
+            "titulo": "Serviços Consulares",
+            "excerto": "Serviços consulares da Embaixada de Angola na Alemanha",
+            "metaTitulo": "Serviços Consulares - Embaixada de Angola na Alemanha",
+        }],
+    },
+)
+
+
+# Shared by every thread that calls the SI backend
+SI_RATE_LIMITER = RateLimiter(SI_REQUESTS_PER_SECOND)
+
+
 # ── State management ─────────────────────────────────────────────────────────
 
 class MigrationState:
@@ -102,20 +266,31 @@ class MigrationState:
             "wp_media_si": {},     # wp_id -> si_media_id
             "wp_media_wn": {},     # wp_id -> wn_media_id
             "si_menus": {},        # location -> menu_id
+            "si_menu_items": [],   # locations whose items were all added
             "si_contacts": [],
             "completed_steps": [],
         }
+        self._last_save = 0.0
+        # Featured media of the mapped WP pages; derived, so not persisted
+        self.page_media_ids: set[int] | None = None
         self._load()
 
     def _load(self):
         if STATE_FILE.exists():
-            with open(STATE_FILE) as f:
-                saved = json.load(f)
-                self.data.update(saved)
+            self.data.update(orjson.loads(STATE_FILE.read_bytes()))
 
     def save(self):
-        with open(STATE_FILE, "w") as f:
-            json.dump(self.data, f, indent=2)
+        STATE_FILE.write_bytes(orjson.dumps(self.data, option=orjson.OPT_INDENT_2))
+        self._last_save = time.monotonic()
+
+    def save_throttled(self):
+        """Save at most once per SAVE_INTERVAL; used inside per-item loops.
+
+        Step boundaries (mark_step) and the end of the run call save() so
+        nothing recorded in memory is left unwritten.
+        """
+        if time.monotonic() - self._last_save >= SAVE_INTERVAL:
+            self.save()
 
     def mark_step(self, step: str):
         if step not in self.data["completed_steps"]:
@@ -131,69 +306,129 @@ class MigrationState:
 def get_keycloak_token() -> str:
     """Get admin JWT token from Keycloak."""
     url = f"{KEYCLOAK_URL}/realms/{KEYCLOAK_REALM}/protocol/openid-connect/token"
-    resp = requests.post(url, data={
+    resp = SESSION.post(url, data={
         "grant_type": "password",
         "client_id": KEYCLOAK_CLIENT,
         "username": KEYCLOAK_USER,
         "password": KEYCLOAK_PASSWORD,
     }, timeout=10)
     if resp.status_code != 200:
-        print(f"[ERROR] Keycloak auth failed ({resp.status_code}): {resp.text}")
+        log.error("[ERROR] Keycloak auth failed (%s): %s", resp.status_code, error_body(resp))
         sys.exit(1)
     token = resp.json()["access_token"]
-    print(f"[OK] Authenticated as {KEYCLOAK_USER}")
+    log.info("[OK] Authenticated as %s", KEYCLOAK_USER)
     return token
 
 
+def error_body(resp: requests.Response, limit: int = 200) -> str:
+    """First `limit` bytes of an error response, for log lines.
+
+    Decodes only that prefix as UTF-8 instead of resp.text, which would
+    decode (and possibly charset-sniff) the whole body.
+    """
+    return resp.content[:limit].decode("utf-8", "replace")
+
+
 def auth_headers(token: str) -> dict:
     return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
 
 # ── WordPress fetcher ────────────────────────────────────────────────────────
 
+# (endpoint, params) -> items, filled by wp_fetch_all for the lifetime of the run
+_WP_CACHE: dict[tuple, list] = {}
+
+
+def _wp_fetch_page(endpoint: str, params: dict | None, page: int) -> tuple[list, int]:
+    """Fetch one page of a WP REST API listing; returns (items, total_pages)."""
+    p = {"per_page": WP_PER_PAGE, "page": page}
+    if params:
+        p.update(params)
+
+    # Re-runs within WP_CACHE_TTL read the page from disk instead of the API
+    params_hash = hashlib.sha1(orjson.dumps(p, option=orjson.OPT_SORT_KEYS)).hexdigest()[:12]
+    cache_file = WP_CACHE_DIR / f"{endpoint.replace('/', '_')}_p{page}_{params_hash}.json"
+    try:
+        cached = orjson.loads(cache_file.read_bytes())
+        items, total_pages = cached["items"], cached["total_pages"]
+        if time.time() - cache_file.stat().st_mtime < WP_CACHE_TTL:
+            return items, total_pages
+    except (OSError, ValueError, KeyError):
+        cached = None  # Missing or unreadable cache entry: fetch it
+
+    # A stale entry is revalidated: an unchanged page comes back as 304
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    resp = SESSION.get(f"{WP_BASE}/{endpoint}", params=p, headers=headers, timeout=30)
+    if resp.status_code == 304 and cached:
+        cache_file.touch()
+        return items, total_pages
+    if resp.status_code == 400:
+        return [], 0  # Past last page
+    resp.raise_for_status()
+    items = resp.json()
+    total_pages = int(resp.headers.get("X-WP-TotalPages", 1))
+
+    WP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(".tmp")
+    tmp_file.write_bytes(orjson.dumps({
+        "items": items,
+        "total_pages": total_pages,
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+    }))
+    os.replace(tmp_file, cache_file)
+    return items, total_pages
+
+
 def wp_fetch_all(endpoint: str, params: dict = None) -> list:
-    """Fetch all items from a WP REST API endpoint, handling pagination."""
-    items = []
-    page = 1
-    per_page = 100
-    while True:
-        p = {"per_page": per_page, "page": page}
-        if params:
-            p.update(params)
-        resp = requests.get(f"{WP_BASE}/{endpoint}", params=p, timeout=30)
-        if resp.status_code == 400:
-            break  # Past last page
-        resp.raise_for_status()
-        batch = resp.json()
-        if not batch:
-            break
-        items.extend(batch)
-        total_pages = int(resp.headers.get("X-WP-TotalPages", 1))
-        if page >= total_pages:
-            break
-        page += 1
-        time.sleep(0.3)  # Be polite
-    return items
-
-
-def wp_clean_html(html: str) -> str:
+    """Fetch all items from a WP REST API endpoint, handling pagination.
+
+    The first page tells us X-WP-TotalPages; the remaining pages are then
+    fetched concurrently (bounded by WP_FETCH_WORKERS) and kept in order.
+    Results are memoised per run, so later steps reuse earlier fetches.
+    """
+    key = (endpoint, tuple(sorted((params or {}).items())))
+    if key in _WP_CACHE:
+        return list(_WP_CACHE[key])
+
+    items, total_pages = _wp_fetch_page(endpoint, params, 1)
+    if items and total_pages > 1:
+        with ThreadPoolExecutor(max_workers=WP_FETCH_WORKERS) as pool:
+            pages = pool.map(lambda page: _wp_fetch_page(endpoint, params, page)[0],
+                             range(2, total_pages + 1))
+            for batch in pages:
+                items.extend(batch)
+    _WP_CACHE[key] = items
+    return list(items)
+
+
+_RE_MANY_NL = re.compile(r"\n{3,}")
+
+
+def wp_clean_html(content: str) -> str:
     """Clean WordPress HTML content, removing Divi builder artifacts."""
-    if not html:
+    if not content:
         return ""
-    soup = BeautifulSoup(html, "html.parser")
+    root = lxml.html.fragment_fromstring(content, create_parent="div")
 
     # Remove Divi builder wrapper divs
-    for div in soup.find_all("div", class_=re.compile(r"et_pb_")):
-        div.unwrap()
+    for div in root.xpath(".//div[contains(@class, 'et_pb_')]"):
+        div.drop_tag()
 
     # Remove empty divs
-    for div in soup.find_all("div"):
-        if not div.get_text(strip=True) and not div.find("img"):
-            div.decompose()
-
-    # Clean up excessive whitespace
-    text = str(soup)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    for div in root.xpath(".//div[not(.//img)]"):
+        if not div.text_content().strip():
+            div.drop_tree()
+
+    # Serialise the children of the synthetic parent, then clean up
+    # excessive whitespace
+    text = lxml.html.tostring(root, encoding="unicode")[len("<div>"):-len("</div>")]
+    text = _RE_MANY_NL.sub("\n\n", text)
     return text.strip()
 
 
@@ -201,8 +436,12 @@ def wp_extract_excerpt(content: str, max_len: int = 300) -> str:
     """Extract a plain-text excerpt from HTML content."""
     if not content:
         return ""
-    soup = BeautifulSoup(content, "html.parser")
-    text = soup.get_text(separator=" ", strip=True)
+    root = lxml.html.fragment_fromstring(content, create_parent="div")
+    # Script and style bodies aren't visible text; comments are skipped by
+    # itertext(). Join the stripped text nodes like get_text(" ", strip=True).
+    for node in root.xpath(".//script | .//style"):
+        node.drop_tree()
+    text = " ".join(filter(None, (chunk.strip() for chunk in root.itertext())))
     if len(text) > max_len:
         text = text[:max_len].rsplit(" ", 1)[0] + "..."
     return text
@@ -210,78 +449,103 @@ def wp_extract_excerpt(content: str, max_len: int = 300) -> str:
 
 # ── Media download/upload ────────────────────────────────────────────────────
 
+@lru_cache(maxsize=2048)
+def _filename_from_url(url: str) -> str:
+    return Path(urlparse(url).path).name
+
+
 def download_media(url: str) -> Path | None:
     """Download a media file from WordPress to local cache."""
     MEDIA_DIR.mkdir(parents=True, exist_ok=True)
-    parsed = urlparse(url)
-    filename = Path(parsed.path).name
+    filename = _filename_from_url(url)
     local_path = MEDIA_DIR / filename
 
     if local_path.exists():
         return local_path
 
+    # Media items can share a basename, so write to a private temp file and
+    # rename it into place: local_path never exists half-written
+    tmp_path = local_path.with_name(f"{filename}.{uuid.uuid4().hex}.part")
     try:
-        resp = requests.get(url, timeout=60, stream=True)
+        resp = SESSION.get(url, timeout=60, stream=True)
         resp.raise_for_status()
-        with open(local_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
-        print(f"  [DL] {filename} ({local_path.stat().st_size // 1024}KB)")
+        resp.raw.decode_content = True  # Undo any Content-Encoding, like iter_content
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(resp.raw, f, length=64 * 1024)
+        os.replace(tmp_path, local_path)
+        log.info("  [DL] %s (%sKB)", filename, local_path.stat().st_size // 1024)
         return local_path
     except Exception as e:
-        print(f"  [WARN] Failed to download {url}: {e}")
+        tmp_path.unlink(missing_ok=True)
+        log.warning("  [WARN] Failed to download %s: %s", url, e)
         return None
 
 
-def upload_media_si(token: str, file_path: Path, alt_pt: str = "") -> dict | None:
+def upload_media_si(headers: dict, file_path: Path, alt_pt: str = "") -> dict | None:
     """Upload a media file to SI backend."""
-    headers = {"Authorization": f"Bearer {token}"}
     with open(file_path, "rb") as f:
         files = {"file": (file_path.name, f)}
         data = {}
         if alt_pt:
             data["altPt"] = alt_pt
-        resp = requests.post(
+        SI_RATE_LIMITER.acquire()
+        resp = SESSION.post(
             f"{SI_BACKEND}/api/v1/media",
             headers=headers, files=files, data=data, timeout=60,
         )
     if resp.status_code in (200, 201):
         result = resp.json()
         return result.get("data", result)
-    print(f"  [WARN] SI media upload failed for {file_path.name}: {resp.status_code} {resp.text[:200]}")
+    log.warning("  [WARN] SI media upload failed for %s: %s %s", file_path.name, resp.status_code, error_body(resp))
     return None
 
 
-def upload_media_wn(token: str, file_path: Path, alt_pt: str = "") -> dict | None:
+def upload_media_wn(headers: dict, file_path: Path, alt_pt: str = "") -> dict | None:
     """Upload a media file to WN backend."""
-    headers = {"Authorization": f"Bearer {token}"}
     with open(file_path, "rb") as f:
         files = {"file": (file_path.name, f)}
         data = {}
         if alt_pt:
             data["altPt"] = alt_pt
-        resp = requests.post(
+        resp = SESSION.post(
             f"{WN_BACKEND}/api/v1/media",
             headers=headers, files=files, data=data, timeout=60,
         )
     if resp.status_code in (200, 201):
         result = resp.json()
         return result.get("data", result)
-    print(f"  [WARN] WN media upload failed for {file_path.name}: {resp.status_code} {resp.text[:200]}")
+    log.warning("  [WARN] WN media upload failed for %s: %s %s", file_path.name, resp.status_code, error_body(resp))
     return None
 
 
+# Backend → (uploader, state key)
+MEDIA_TARGETS = {
+    "WN": (upload_media_wn, "wp_media_wn"),
+    "SI": (upload_media_si, "wp_media_si"),
+}
+
+
+def mapped_page_media_ids(state: MigrationState) -> set[int]:
+    """Featured media ids of the WP pages in WP_PAGE_MAP, computed once per run."""
+    if state.page_media_ids is None:
+        state.page_media_ids = {
+            p["featured_media"] for p in wp_fetch_all("pages")
+            if p.get("featured_media") and p["id"] in WP_PAGE_MAP
+        }
+    return state.page_media_ids
+
+
 # ── Step 1: Migrate WP Categories → WN Categories ───────────────────────────
 
 def migrate_categories(token: str, state: MigrationState, dry_run: bool = False):
     step = "categories"
     if state.is_done(step):
-        print(f"[SKIP] {step} already done")
+        log.info("[SKIP] %s already done", step)
         return
 
-    print("\n=== Step 1: WP Categories → WN Categories ===")
+    log.info("\n=== Step 1: WP Categories → WN Categories ===")
     wp_cats = wp_fetch_all("categories")
-    print(f"  Found {len(wp_cats)} WP categories")
+    log.info("  Found %s WP categories", len(wp_cats))
 
     headers = auth_headers(token)
 
@@ -293,7 +557,7 @@ def migrate_categories(token: str, state: MigrationState, dry_run: bool = False)
             continue
 
         if str(wp_id) in state.data["wp_categories"]:
-            print(f"  [SKIP] {slug} (already migrated)")
+            log.info("  [SKIP] %s (already migrated)", slug)
             continue
 
         mapping = WP_CATEGORY_MAP.get(slug, {})
@@ -309,23 +573,23 @@ def migrate_categories(token: str, state: MigrationState, dry_run: bool = False)
         }
 
         if dry_run:
-            print(f"  [DRY] Would create category: {slug}")
+            log.info("  [DRY] Would create category: %s", slug)
             continue
 
-        resp = requests.post(f"{WN_BACKEND}/api/v1/categories", headers=headers, json=payload, timeout=10)
+        resp = SESSION.post(f"{WN_BACKEND}/api/v1/categories", headers=headers, data=orjson.dumps(payload), timeout=10)
         if resp.status_code in (200, 201):
             result = resp.json()
             data = result.get("data", result)
             wn_id = data.get("id")
             state.data["wp_categories"][str(wp_id)] = wn_id
-            state.save()
-            print(f"  [OK] {slug} → {wn_id}")
+            state.save_throttled()
+            log.info("  [OK] %s → %s", slug, wn_id)
         else:
-            print(f"  [ERR] {slug}: {resp.status_code} {resp.text[:200]}")
+            log.error("  [ERR] %s: %s %s", slug, resp.status_code, error_body(resp))
 
     if not dry_run:
         state.mark_step(step)
-    print(f"  Migrated {len(state.data['wp_categories'])} categories")
+    log.info("  Migrated %s categories", len(state.data['wp_categories']))
 
 
 # ── Step 2: Create WN Author ────────────────────────────────────────────────
@@ -333,13 +597,13 @@ def migrate_categories(token: str, state: MigrationState, dry_run: bool = False)
 def create_wn_author(token: str, state: MigrationState, dry_run: bool = False):
     step = "author"
     if state.is_done(step):
-        print(f"[SKIP] {step} already done")
+        log.info("[SKIP] %s already done", step)
         return
 
-    print("\n=== Step 2: Create WN Author ===")
+    log.info("\n=== Step 2: Create WN Author ===")
 
     if state.data["wn_author_id"]:
-        print(f"  [SKIP] Author already exists: {state.data['wn_author_id']}")
+        log.info("  [SKIP] Author already exists: %s", state.data['wn_author_id'])
         state.mark_step(step)
         return
 
@@ -354,20 +618,20 @@ def create_wn_author(token: str, state: MigrationState, dry_run: bool = False):
     }
 
     if dry_run:
-        print(f"  [DRY] Would create author: {payload['nome']}")
+        log.info("  [DRY] Would create author: %s", payload['nome'])
         return
 
     headers = auth_headers(token)
-    resp = requests.post(f"{WN_BACKEND}/api/v1/authors", headers=headers, json=payload, timeout=10)
+    resp = SESSION.post(f"{WN_BACKEND}/api/v1/authors", headers=headers, data=orjson.dumps(payload), timeout=10)
     if resp.status_code in (200, 201):
         result = resp.json()
         data = result.get("data", result)
         state.data["wn_author_id"] = data.get("id")
         state.save()
         state.mark_step(step)
-        print(f"  [OK] Author created: {state.data['wn_author_id']}")
+        log.info("  [OK] Author created: %s", state.data['wn_author_id'])
     else:
-        print(f"  [ERR] Author creation failed: {resp.status_code} {resp.text[:200]}")
+        log.error("  [ERR] Author creation failed: %s %s", resp.status_code, error_body(resp))
 
 
 # ── Step 3: Migrate WP Posts → WN Articles ──────────────────────────────────
@@ -375,12 +639,12 @@ def create_wn_author(token: str, state: MigrationState, dry_run: bool = False):
 def migrate_posts(token: str, state: MigrationState, dry_run: bool = False):
     step = "posts"
     if state.is_done(step):
-        print(f"[SKIP] {step} already done")
+        log.info("[SKIP] %s already done", step)
         return
 
-    print("\n=== Step 3: WP Posts → WN Articles ===")
+    log.info("\n=== Step 3: WP Posts → WN Articles ===")
     wp_posts = wp_fetch_all("posts")
-    print(f"  Found {len(wp_posts)} WP posts")
+    log.info("  Found %s WP posts", len(wp_posts))
 
     headers = auth_headers(token)
     author_id = state.data.get("wn_author_id")
@@ -392,7 +656,7 @@ def migrate_posts(token: str, state: MigrationState, dry_run: bool = False):
             continue
 
         slug = post["slug"]
-        title = BeautifulSoup(post["title"]["rendered"], "html.parser").get_text()
+        title = html.unescape(post["title"]["rendered"])
         content = wp_clean_html(post["content"]["rendered"])
         excerpt_html = post.get("excerpt", {}).get("rendered", "")
         excerpt = wp_extract_excerpt(excerpt_html or content, 400)
@@ -423,6 +687,9 @@ def migrate_posts(token: str, state: MigrationState, dry_run: bool = False):
             "metaTituloPt": title[:160],
             "metaDescricaoPt": excerpt[:320],
             "featured": False,
+            # Ask the backend to publish on create; the editorial workflow
+            # below is only walked if it ignores this.
+            "estado": "PUBLISHED",
         }
 
         if wn_category_id:
@@ -433,41 +700,36 @@ def migrate_posts(token: str, state: MigrationState, dry_run: bool = False):
             payload["featuredImageId"] = featured_image_id
 
         if dry_run:
-            print(f"  [DRY] Would create article: {slug}")
+            log.info("  [DRY] Would create article: %s", slug)
             continue
 
-        resp = requests.post(f"{WN_BACKEND}/api/v1/articles", headers=headers, json=payload, timeout=15)
+        resp = SESSION.post(f"{WN_BACKEND}/api/v1/articles", headers=headers, data=orjson.dumps(payload), timeout=15)
         if resp.status_code in (200, 201):
             result = resp.json()
             data = result.get("data", result)
             article_id = data.get("id")
             state.data["wp_posts"][str(wp_id)] = article_id
-            state.save()
+            state.save_throttled()
 
-            # Publish the article via editorial workflow
-            requests.patch(
-                f"{WN_BACKEND}/api/v1/editorial/articles/{article_id}/submit",
-                headers=headers, timeout=10,
-            )
-            requests.patch(
-                f"{WN_BACKEND}/api/v1/editorial/articles/{article_id}/review",
-                headers=headers, timeout=10,
-            )
-            requests.patch(
-                f"{WN_BACKEND}/api/v1/editorial/articles/{article_id}/publish",
-                headers=headers, timeout=10,
-            )
+            # Publish the article via editorial workflow, unless the
+            # backend already created it as published
+            if data.get("estado") != "PUBLISHED":
+                for transition in ("submit", "review", "publish"):
+                    SESSION.patch(
+                        f"{WN_BACKEND}/api/v1/editorial/articles/{article_id}/{transition}",
+                        headers=headers, timeout=10,
+                    )
 
             migrated += 1
-            print(f"  [OK] {slug} → {article_id}")
+            log.info("  [OK] %s → %s", slug, article_id)
         else:
-            print(f"  [ERR] {slug}: {resp.status_code} {resp.text[:200]}")
+            log.error("  [ERR] %s: %s %s", slug, resp.status_code, error_body(resp))
 
         time.sleep(0.2)
 
     if not dry_run:
         state.mark_step(step)
-    print(f"  Migrated {migrated} articles")
+    log.info("  Migrated %s articles", migrated)
 
 
 # ── Step 4: Migrate WP Pages → SI Pages ─────────────────────────────────────
@@ -475,12 +737,12 @@ def migrate_posts(token: str, state: MigrationState, dry_run: bool = False):
 def migrate_pages(token: str, state: MigrationState, dry_run: bool = False):
     step = "pages"
     if state.is_done(step):
-        print(f"[SKIP] {step} already done")
+        log.info("[SKIP] %s already done", step)
         return
 
-    print("\n=== Step 4: WP Pages → SI Pages ===")
+    log.info("\n=== Step 4: WP Pages → SI Pages ===")
     wp_pages = wp_fetch_all("pages")
-    print(f"  Found {len(wp_pages)} WP pages")
+    log.info("  Found %s WP pages", len(wp_pages))
 
     headers = auth_headers(token)
     migrated = 0
@@ -492,12 +754,11 @@ def migrate_pages(token: str, state: MigrationState, dry_run: bool = False):
 
         # Only migrate pages we have explicit mappings for
         mapping = WP_PAGE_MAP.get(wp_id)
+        title = html.unescape(page["title"]["rendered"])
         if not mapping:
-            title = BeautifulSoup(page["title"]["rendered"], "html.parser").get_text()
-            print(f"  [SKIP] No mapping for WP page {wp_id}: {title}")
+            log.info("  [SKIP] No mapping for WP page %s: %s", wp_id, title)
             continue
 
-        title = BeautifulSoup(page["title"]["rendered"], "html.parser").get_text()
         content = wp_clean_html(page["content"]["rendered"])
         excerpt = wp_extract_excerpt(content, 400)
 
@@ -527,33 +788,33 @@ def migrate_pages(token: str, state: MigrationState, dry_run: bool = False):
             payload["featuredImageId"] = featured_image_id
 
         if dry_run:
-            print(f"  [DRY] Would create page: {mapping['slug']} ({title})")
+            log.info("  [DRY] Would create page: %s (%s)", mapping['slug'], title)
             continue
 
-        resp = requests.post(f"{SI_BACKEND}/api/v1/pages", headers=headers, json=payload, timeout=15)
+        SI_RATE_LIMITER.acquire()
+        resp = SESSION.post(f"{SI_BACKEND}/api/v1/pages", headers=headers, data=orjson.dumps(payload), timeout=15)
         if resp.status_code in (200, 201):
             result = resp.json()
             data = result.get("data", result)
             page_id = data.get("id")
             state.data["wp_pages"][str(wp_id)] = page_id
-            state.save()
+            state.save_throttled()
 
             # Publish the page (estado update)
-            requests.patch(
+            SI_RATE_LIMITER.acquire()
+            SESSION.patch(
                 f"{SI_BACKEND}/api/v1/pages/{page_id}/estado",
-                headers=headers, json={"estado": "PUBLISHED"}, timeout=10,
+                headers=headers, data=orjson.dumps({"estado": "PUBLISHED"}), timeout=10,
             )
 
             migrated += 1
-            print(f"  [OK] {mapping['slug']} → {page_id}")
+            log.info("  [OK] %s → %s", mapping['slug'], page_id)
         else:
-            print(f"  [ERR] {mapping['slug']}: {resp.status_code} {resp.text[:200]}")
-
-        time.sleep(0.2)
+            log.error("  [ERR] %s: %s %s", mapping['slug'], resp.status_code, error_body(resp))
 
     if not dry_run:
         state.mark_step(step)
-    print(f"  Migrated {migrated} pages")
+    log.info("  Migrated %s pages", migrated)
 
 
 # ── Step 5: Migrate Media ───────────────────────────────────────────────────
@@ -561,109 +822,159 @@ def migrate_pages(token: str, state: MigrationState, dry_run: bool = False):
 def migrate_media(token: str, state: MigrationState, dry_run: bool = False):
     step = "media"
     if state.is_done(step):
-        print(f"[SKIP] {step} already done")
+        log.info("[SKIP] %s already done", step)
         return
 
-    print("\n=== Step 5: WP Media → SI + WN Media ===")
+    log.info("\n=== Step 5: WP Media → SI + WN Media ===")
     wp_media = wp_fetch_all("media")
-    print(f"  Found {len(wp_media)} WP media items")
+    log.info("  Found %s WP media items", len(wp_media))
 
     # Download media referenced by posts (for WN) and pages (for SI)
-    post_media_ids = set()
-    page_media_ids = set()
-
     wp_posts = wp_fetch_all("posts")
-    for post in wp_posts:
-        fm = post.get("featured_media")
-        if fm:
-            post_media_ids.add(fm)
-
-    wp_pages = wp_fetch_all("pages")
-    for page in wp_pages:
-        if page["id"] in WP_PAGE_MAP:
-            fm = page.get("featured_media")
-            if fm:
-                page_media_ids.add(fm)
+    post_media_ids = {p["featured_media"] for p in wp_posts if p.get("featured_media")}
 
-    uploaded_wn = 0
-    uploaded_si = 0
+    page_media_ids = mapped_page_media_ids(state)
 
+    # Work out which backends each image still has to go to, then download
+    # and upload concurrently. State is only touched from this thread.
+    work = []
     for media in wp_media:
+        # Only download images (skip PDFs, videos for now)
+        if not media.get("mime_type", "").startswith("image/"):
+            continue
+
         wp_mid = media["id"]
         source_url = media.get("source_url", "")
-        alt = media.get("alt_text", "")
-        title = BeautifulSoup(media.get("title", {}).get("rendered", ""), "html.parser").get_text()
-
         if not source_url:
             continue
 
-        # Only download images (skip PDFs, videos for now)
-        mime = media.get("mime_type", "")
-        if not mime.startswith("image/"):
-            continue
-
+        targets = []
         # Upload to WN if used by posts
         if wp_mid in post_media_ids and str(wp_mid) not in state.data["wp_media_wn"]:
-            local_file = download_media(source_url)
-            if local_file and not dry_run:
-                result = upload_media_wn(token, local_file, alt or title)
-                if result:
-                    state.data["wp_media_wn"][str(wp_mid)] = result.get("id")
-                    state.save()
-                    uploaded_wn += 1
-                    print(f"  [OK→WN] {local_file.name} → {result.get('id')}")
-            elif dry_run:
-                print(f"  [DRY→WN] Would upload {source_url}")
-
+            targets.append("WN")
         # Upload to SI if used by pages
         if wp_mid in page_media_ids and str(wp_mid) not in state.data["wp_media_si"]:
-            local_file = download_media(source_url)
-            if local_file and not dry_run:
-                result = upload_media_si(token, local_file, alt or title)
+            targets.append("SI")
+        if targets:
+            alt = media.get("alt_text", "") or html.unescape(media.get("title", {}).get("rendered", ""))
+            work.append((wp_mid, source_url, alt, targets))
+
+    # Downloads feed uploads: as soon as a file is on disk (or already
+    # cached) its uploads are queued on the upload pool while the remaining
+    # downloads carry on.
+    uploaded = {"WN": 0, "SI": 0}
+    # Auth only: requests sets the multipart Content-Type for each upload
+    upload_headers = {"Authorization": f"Bearer {token}"}
+    with ThreadPoolExecutor(max_workers=MEDIA_DOWNLOAD_WORKERS) as downloads, \
+            ThreadPoolExecutor(max_workers=MEDIA_UPLOAD_WORKERS) as uploads:
+        pending = {
+            downloads.submit(download_media, source_url): ("download", wp_mid, source_url, alt, targets)
+            for wp_mid, source_url, alt, targets in work
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, wp_mid, *job = pending.pop(future)
+                # One failed job must not abort the loop: leaving the pools
+                # early would drop the ids of uploads still in flight
+                try:
+                    result = future.result()
+                except Exception as e:
+                    log.warning("  [WARN] Media %s %s failed: %s", wp_mid, kind, e)
+                    continue
+
+                if kind == "download":
+                    # Queue one upload per backend for the downloaded file
+                    source_url, alt, targets = job
+                    local_file = result
+                    for target in targets:
+                        if dry_run:
+                            log.info("  [DRY→%s] Would upload %s", target, source_url)
+                        elif local_file:
+                            upload, _ = MEDIA_TARGETS[target]
+                            upload_future = uploads.submit(upload, upload_headers, local_file, alt)
+                            pending[upload_future] = ("upload", wp_mid, target, local_file)
+                    continue
+
+                target, local_file = job
                 if result:
-                    state.data["wp_media_si"][str(wp_mid)] = result.get("id")
-                    state.save()
-                    uploaded_si += 1
-                    print(f"  [OK→SI] {local_file.name} → {result.get('id')}")
-            elif dry_run:
-                print(f"  [DRY→SI] Would upload {source_url}")
+                    state.data[MEDIA_TARGETS[target][1]][str(wp_mid)] = result.get("id")
+                    state.save_throttled()
+                    uploaded[target] += 1
+                    log.info("  [OK→%s] %s → %s", target, local_file.name, result.get('id'))
 
     if not dry_run:
         state.mark_step(step)
-    print(f"  Uploaded {uploaded_wn} to WN, {uploaded_si} to SI")
+    log.info("  Uploaded %s to WN, %s to SI", uploaded['WN'], uploaded['SI'])
 
 
 # ── Step 6: Create SI Menus ─────────────────────────────────────────────────
 
+def add_menu_items(headers: dict, menu_id: str, items: list[dict], label: str) -> bool:
+    """Add items to an SI menu, in a single batch request when possible.
+
+    Falls back to one POST per item whenever the batch request is rejected
+    for anything but auth (401/403): backends without the batch endpoint
+    answer 404/405, but some route unmapped paths to a 400 or 500. Returns
+    True only if every item was created.
+    """
+    SI_RATE_LIMITER.acquire()
+    resp = SESSION.post(
+        f"{SI_BACKEND}/api/v1/menus/{menu_id}/items:batch",
+        headers=headers, data=orjson.dumps({"items": items}), timeout=10,
+    )
+    if resp.status_code in (200, 201):
+        log.info("    [OK] %s items: %s", label, ", ".join(item["labelPt"] for item in items))
+        return True
+    if resp.status_code in (401, 403):
+        log.error("    [ERR] %s items: %s %s", label, resp.status_code, error_body(resp, 100))
+        return False
+
+    complete = True
+    for item in items:
+        SI_RATE_LIMITER.acquire()
+        resp = SESSION.post(
+            f"{SI_BACKEND}/api/v1/menus/{menu_id}/items",
+            headers=headers, data=orjson.dumps(item), timeout=10,
+        )
+        if resp.status_code in (200, 201):
+            log.info("    [OK] %s item: %s", label, item["labelPt"])
+        else:
+            log.error("    [ERR] %s item %s: %s %s", label, item["labelPt"], resp.status_code, error_body(resp, 100))
+            complete = False
+    return complete
+
+
 def create_si_menus(token: str, state: MigrationState, dry_run: bool = False):
     step = "menus"
     if state.is_done(step):
-        print(f"[SKIP] {step} already done")
+        log.info("[SKIP] %s already done", step)
         return
 
-    print("\n=== Step 6: Create SI Menus ===")
+    log.info("\n=== Step 6: Create SI Menus ===")
     headers = auth_headers(token)
 
     # ── HEADER menu ──────────────────────────────────────────────────────
     if "HEADER" not in state.data["si_menus"]:
         payload = {"nome": "Menu Principal", "localizacao": "HEADER"}
         if dry_run:
-            print("  [DRY] Would create HEADER menu")
+            log.info("  [DRY] Would create HEADER menu")
         else:
-            resp = requests.post(f"{SI_BACKEND}/api/v1/menus", headers=headers, json=payload, timeout=10)
+            SI_RATE_LIMITER.acquire()
+            resp = SESSION.post(f"{SI_BACKEND}/api/v1/menus", headers=headers, data=orjson.dumps(payload), timeout=10)
             if resp.status_code in (200, 201):
                 result = resp.json()
                 data = result.get("data", result)
                 menu_id = data.get("id")
                 state.data["si_menus"]["HEADER"] = menu_id
                 state.save()
-                print(f"  [OK] HEADER menu → {menu_id}")
+                log.info("  [OK] HEADER menu → %s", menu_id)
             else:
-                print(f"  [ERR] HEADER menu: {resp.status_code} {resp.text[:200]}")
+                log.error("  [ERR] HEADER menu: %s %s", resp.status_code, error_body(resp))
 
     # Add HEADER menu items
     header_id = state.data["si_menus"].get("HEADER")
-    if header_id and not dry_run:
+    if header_id and not dry_run and "HEADER" not in state.data["si_menu_items"]:
         header_items = [
             {
                 "labelPt": "Início",
@@ -723,35 +1034,30 @@ def create_si_menus(token: str, state: MigrationState, dry_run: bool = False):
             },
         ]
 
-        for item in header_items:
-            resp = requests.post(
-                f"{SI_BACKEND}/api/v1/menus/{header_id}/items",
-                headers=headers, json=item, timeout=10,
-            )
-            if resp.status_code in (200, 201):
-                print(f"    [OK] Header item: {item['labelPt']}")
-            else:
-                print(f"    [ERR] Header item {item['labelPt']}: {resp.status_code} {resp.text[:100]}")
+        if add_menu_items(headers, header_id, header_items, "Header"):
+            state.data["si_menu_items"].append("HEADER")
+            state.save()
 
     # ── FOOTER menu ──────────────────────────────────────────────────────
     if "FOOTER" not in state.data["si_menus"]:
         payload = {"nome": "Menu Rodapé", "localizacao": "FOOTER"}
         if dry_run:
-            print("  [DRY] Would create FOOTER menu")
+            log.info("  [DRY] Would create FOOTER menu")
         else:
-            resp = requests.post(f"{SI_BACKEND}/api/v1/menus", headers=headers, json=payload, timeout=10)
+            SI_RATE_LIMITER.acquire()
+            resp = SESSION.post(f"{SI_BACKEND}/api/v1/menus", headers=headers, data=orjson.dumps(payload), timeout=10)
             if resp.status_code in (200, 201):
                 result = resp.json()
                 data = result.get("data", result)
                 menu_id = data.get("id")
                 state.data["si_menus"]["FOOTER"] = menu_id
                 state.save()
-                print(f"  [OK] FOOTER menu → {menu_id}")
+                log.info("  [OK] FOOTER menu → %s", menu_id)
             else:
-                print(f"  [ERR] FOOTER menu: {resp.status_code} {resp.text[:200]}")
+                log.error("  [ERR] FOOTER menu: %s %s", resp.status_code, error_body(resp))
 
     footer_id = state.data["si_menus"].get("FOOTER")
-    if footer_id and not dry_run:
+    if footer_id and not dry_run and "FOOTER" not in state.data["si_menu_items"]:
         footer_items = [
             {
                 "labelPt": "Sobre Angola",
@@ -783,231 +1089,160 @@ def create_si_menus(token: str, state: MigrationState, dry_run: bool = False):
             },
         ]
 
-        for item in footer_items:
-            resp = requests.post(
-                f"{SI_BACKEND}/api/v1/menus/{footer_id}/items",
-                headers=headers, json=item, timeout=10,
-            )
-            if resp.status_code in (200, 201):
-                print(f"    [OK] Footer item: {item['labelPt']}")
-            else:
-                print(f"    [ERR] Footer item {item['labelPt']}: {resp.status_code} {resp.text[:100]}")
+        if add_menu_items(headers, footer_id, footer_items, "Footer"):
+            state.data["si_menu_items"].append("FOOTER")
+            state.save()
 
-    if not dry_run:
+    # Leave the step open while a menu or its items are missing, so the
+    # next run picks up where this one failed
+    if not dry_run and {"HEADER", "FOOTER"} <= set(state.data["si_menu_items"]):
         state.mark_step(step)
 
 
 # ── Step 7: Create SI Contacts ──────────────────────────────────────────────
 
+def post_si_contact(headers: dict, contact: dict) -> requests.Response:
+    SI_RATE_LIMITER.acquire()
+    return SESSION.post(f"{SI_BACKEND}/api/v1/contacts", headers=headers, data=orjson.dumps(contact), timeout=10)
+
+
 def create_si_contacts(token: str, state: MigrationState, dry_run: bool = False):
     step = "contacts"
     if state.is_done(step):
-        print(f"[SKIP] {step} already done")
+        log.info("[SKIP] %s already done", step)
         return
 
-    print("\n=== Step 7: Create SI Contact Info ===")
+    log.info("\n=== Step 7: Create SI Contact Info ===")
     headers = auth_headers(token)
 
-    contacts = [
-        {
-            "departamento": "Embaixada da República de Angola",
-            "endereco": "Wallstraße 58",
-            "cidade": "Berlin",
-            "codigoPostal": "10179",
-            "pais": "Deutschland",
-            "telefone": "+49 30 240 897 0",
-            "fax": "+49 30 240 897 12",
-            "email": "info@botschaftangola.de",
-            "horarioPt": "Segunda a Sexta: 09:00 - 17:00",
-            "horarioEn": "Monday to Friday: 09:00 - 17:00",
-            "horarioDe": "Montag bis Freitag: 09:00 - 17:00",
-            "latitude": 52.5128,
-            "longitude": 13.4125,
-            "sortOrder": 0,
-        },
-        {
-            "departamento": "Secção Consular",
-            "endereco": "Wallstraße 58",
-            "cidade": "Berlin",
-            "codigoPostal": "10179",
-            "pais": "Deutschland",
-            "telefone": "+49 30 240 897 18",
-            "email": "konsulat@botschaftangola.de",
-            "horarioPt": "Segunda a Sexta: 09:00 - 13:00 (Atendimento ao público)",
-            "horarioEn": "Monday to Friday: 09:00 - 13:00 (Public hours)",
-            "horarioDe": "Montag bis Freitag: 09:00 - 13:00 (Publikumsverkehr)",
-            "latitude": 52.5128,
-            "longitude": 13.4125,
-            "sortOrder": 1,
-        },
-        {
-            "departamento": "Secção Consular - Praga (República Checa)",
-            "endereco": "Represented from Berlin",
-            "cidade": "Praha",
-            "pais": "Česká republika",
-            "telefone": "+49 30 240 897 0",
-            "email": "info@botschaftangola.de",
-            "horarioPt": "Atendimento mediante marcação prévia",
-            "horarioEn": "By appointment only",
-            "horarioDe": "Nur nach Terminvereinbarung",
-            "sortOrder": 2,
-        },
-    ]
-
-    for contact in contacts:
-        if dry_run:
-            print(f"  [DRY] Would create contact: {contact['departamento']}")
-            continue
+    if dry_run:
+        for contact in SI_CONTACTS:
+            log.info("  [DRY] Would create contact: %s", contact['departamento'])
+        return
 
-        resp = requests.post(f"{SI_BACKEND}/api/v1/contacts", headers=headers, json=contact, timeout=10)
-        if resp.status_code in (200, 201):
-            result = resp.json()
-            data = result.get("data", result)
-            state.data["si_contacts"].append(data.get("id"))
-            state.save()
-            print(f"  [OK] {contact['departamento']} → {data.get('id')}")
-        else:
-            print(f"  [ERR] {contact['departamento']}: {resp.status_code} {resp.text[:200]}")
+    # The contacts are independent: post them concurrently, record in order.
+    # A request that raised is logged on its own so the others still reach
+    # the state.
+    with ThreadPoolExecutor(max_workers=SI_SETUP_WORKERS) as pool:
+        futures = [pool.submit(post_si_contact, headers, contact) for contact in SI_CONTACTS]
+        for contact, future in zip(SI_CONTACTS, futures):
+            try:
+                resp = future.result()
+            except Exception as e:
+                log.error("  [ERR] %s: %s", contact['departamento'], e)
+                continue
+            if resp.status_code in (200, 201):
+                result = resp.json()
+                data = result.get("data", result)
+                state.data["si_contacts"].append(data.get("id"))
+                log.info("  [OK] %s → %s", contact['departamento'], data.get('id'))
+            else:
+                log.error("  [ERR] %s: %s %s", contact['departamento'], resp.status_code, error_body(resp))
 
-    if not dry_run:
-        state.mark_step(step)
+    state.mark_step(step)  # Single state write for the whole step
 
 
 # ── Step 8: Create additional SI pages (About Angola, Embaixador, etc.) ─────
 
+@cache
+def load_template(name: str) -> str:
+    """Read an HTML body from migration/templates/ (once per process)."""
+    return (TEMPLATES_DIR / name).read_text(encoding="utf-8").strip()
+
+
+def create_and_publish_si_page(headers: dict, page_data: dict) -> tuple[requests.Response, str | None]:
+    """Create an SI page and publish it; returns the create response and page id."""
+    # Ask for the page to be created published; the estado PATCH below is
+    # only needed if the backend ignores this
+    payload = {
+        **page_data,
+        "estado": "PUBLISHED",
+        "translations": [
+            {**t, "conteudo": load_template(f"{page_data['slug']}.{t['idioma'].lower()}.html")}
+            for t in page_data["translations"]
+        ],
+    }
+    SI_RATE_LIMITER.acquire()
+    resp = SESSION.post(f"{SI_BACKEND}/api/v1/pages", headers=headers, data=orjson.dumps(payload), timeout=15)
+    if resp.status_code not in (200, 201):
+        return resp, None
+    result = resp.json()
+    data = result.get("data", result)
+    page_id = data.get("id")
+
+    # Publish the page
+    if data.get("estado") != "PUBLISHED":
+        SI_RATE_LIMITER.acquire()
+        SESSION.patch(
+            f"{SI_BACKEND}/api/v1/pages/{page_id}/estado",
+            headers=headers, data=orjson.dumps({"estado": "PUBLISHED"}), timeout=10,
+        )
+    return resp, page_id
+
+
 def create_additional_si_pages(token: str, state: MigrationState, dry_run: bool = False):
     step = "additional_pages"
     if state.is_done(step):
-        print(f"[SKIP] {step} already done")
+        log.info("[SKIP] %s already done", step)
         return
 
-    print("\n=== Step 8: Create Additional SI Pages ===")
+    log.info("\n=== Step 8: Create Additional SI Pages ===")
     headers = auth_headers(token)
 
-    additional_pages = [
-        {
-            "slug": "sobre-angola",
-            "tipo": "INSTITUTIONAL",
-            "sortOrder": 0,
-            "translations": [{
-                "idioma": "PT",
-                "titulo": "Sobre Angola",
-                "conteudo": "<p>Angola, oficialmente República de Angola, é um país da costa ocidental de África. "
-                            "Com uma área de 1.246.700 km², é o sétimo maior país de África. "
-                            "Faz fronteira com a Namíbia a sul, a República Democrática do Congo a norte e a leste, "
-                            "a República do Congo a noroeste e a Zâmbia a leste. "
-                            "A costa de Angola estende-se por 1.650 km ao longo do Oceano Atlântico.</p>",
-                "excerto": "Informações gerais sobre a República de Angola",
-                "metaTitulo": "Sobre Angola - Embaixada de Angola na Alemanha",
-            }],
-        },
-        {
-            "slug": "embaixador",
-            "tipo": "INSTITUTIONAL",
-            "sortOrder": 0,
-            "translations": [{
-                "idioma": "PT",
-                "titulo": "O Embaixador",
-                "conteudo": "<p>Embaixador da República de Angola na República Federal da Alemanha e República Checa.</p>",
-                "excerto": "Perfil do Embaixador de Angola na Alemanha",
-                "metaTitulo": "Embaixador - Embaixada de Angola na Alemanha",
-            }],
-        },
-        {
-            "slug": "relacoes-bilaterais",
-            "tipo": "INSTITUTIONAL",
-            "sortOrder": 0,
-            "translations": [{
-                "idioma": "PT",
-                "titulo": "Relações Bilaterais Angola-Alemanha",
-                "conteudo": "<p>As relações diplomáticas entre Angola e a Alemanha foram estabelecidas em 1975, "
-                            "logo após a independência de Angola. Desde então, os dois países têm mantido "
-                            "um diálogo construtivo em diversas áreas, incluindo cooperação económica, "
-                            "cultural e técnica.</p>",
-                "excerto": "Relações bilaterais entre Angola e a Alemanha",
-                "metaTitulo": "Relações Bilaterais - Embaixada de Angola na Alemanha",
-            }],
-        },
-        {
-            "slug": "servicos-consulares",
-            "tipo": "SERVICE",
-            "sortOrder": 0,
-            "translations": [{
-                "idioma": "PT",
-                "titulo": "Serviços Consulares",
-                "conteudo": "<p>A Secção Consular da Embaixada de Angola na Alemanha presta diversos serviços "
-                            "aos cidadãos angolanos residentes na Alemanha e na República Checa, "
-                            "bem como a cidadãos estrangeiros que pretendem viajar para Angola.</p>"
-                            "<h3>Serviços Disponíveis</h3>"
-                            "<ul>"
-                            "<li>Vistos de entrada para Angola</li>"
-                            "<li>Passaportes</li>"
-                            "<li>Bilhete de Identidade</li>"
-                            "<li>Registo Civil</li>"
-                            "<li>Certificados e Declarações</li>"
-                            "<li>Legalizações</li>"
-                            "</ul>",
-                "excerto": "Serviços consulares da Embaixada de Angola na Alemanha",
-                "metaTitulo": "Serviços Consulares - Embaixada de Angola na Alemanha",
-            }],
-        },
-    ]
-
-    for page_data in additional_pages:
+    # Slugs created by earlier runs, collected in one pass over wp_pages
+    existing = {
+        key.removeprefix("additional_") for key in state.data["wp_pages"]
+        if key.startswith("additional_")
+    }
+    pending = []
+    for page_data in SI_ADDITIONAL_PAGES:
         slug = page_data["slug"]
-        if any(v for k, v in state.data["wp_pages"].items() if slug in str(v)):
-            print(f"  [SKIP] {slug} (possibly exists)")
-            continue
-
-        if dry_run:
-            print(f"  [DRY] Would create page: {slug}")
+        if slug in existing:
+            log.info("  [SKIP] %s (already created)", slug)
             continue
+        pending.append(page_data)
 
-        resp = requests.post(f"{SI_BACKEND}/api/v1/pages", headers=headers, json=page_data, timeout=15)
-        if resp.status_code in (200, 201):
-            result = resp.json()
-            data = result.get("data", result)
-            page_id = data.get("id")
-            state.data["wp_pages"][f"additional_{slug}"] = page_id
-            state.save()
+    # Nothing is rendered for a preview: templates are only read on create
+    if dry_run:
+        for page_data in pending:
+            log.info("  [DRY] Would create page: %s", page_data["slug"])
+        return
 
-            # Publish the page
-            requests.patch(
-                f"{SI_BACKEND}/api/v1/pages/{page_id}/estado",
-                headers=headers, json={"estado": "PUBLISHED"}, timeout=10,
-            )
-            print(f"  [OK] {slug} → {page_id}")
-        else:
-            print(f"  [ERR] {slug}: {resp.status_code} {resp.text[:200]}")
+    # Create + publish runs per page on a worker; pages proceed in parallel.
+    # A page whose request raised is logged on its own so the pages created
+    # by the other workers still reach the state.
+    with ThreadPoolExecutor(max_workers=SI_SETUP_WORKERS) as pool:
+        futures = [pool.submit(create_and_publish_si_page, headers, page_data) for page_data in pending]
+        for page_data, future in zip(pending, futures):
+            slug = page_data["slug"]
+            try:
+                resp, page_id = future.result()
+            except Exception as e:
+                log.error("  [ERR] %s: %s", slug, e)
+                continue
+            if resp.status_code in (200, 201):
+                state.data["wp_pages"][f"additional_{slug}"] = page_id
+                log.info("  [OK] %s → %s", slug, page_id)
+            else:
+                log.error("  [ERR] %s: %s %s", slug, resp.status_code, error_body(resp))
 
-    if not dry_run:
-        state.mark_step(step)
+    state.mark_step(step)  # Single state write for the whole step
 
 
 # ── Main ─────────────────────────────────────────────────────────────────────
 
-STEPS = {
-    "media": migrate_media,
-    "categories": migrate_categories,
-    "author": create_wn_author,
-    "posts": migrate_posts,
-    "pages": migrate_pages,
-    "menus": create_si_menus,
-    "contacts": create_si_contacts,
-    "additional_pages": create_additional_si_pages,
-}
-
 # Execution order (media first so images are available for posts/pages)
-STEP_ORDER = [
-    "categories",
-    "author",
-    "media",
-    "posts",
-    "pages",
-    "additional_pages",
-    "menus",
-    "contacts",
-]
+STEP_PIPELINE = (
+    ("categories", migrate_categories),
+    ("author", create_wn_author),
+    ("media", migrate_media),
+    ("posts", migrate_posts),
+    ("pages", migrate_pages),
+    ("additional_pages", create_additional_si_pages),
+    ("menus", create_si_menus),
+    ("contacts", create_si_contacts),
+)
+STEPS = dict(STEP_PIPELINE)
 
 
 def main():
@@ -1018,59 +1253,64 @@ def main():
     parser.add_argument("--status", action="store_true", help="Show migration status")
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     state = MigrationState()
 
     if args.reset:
         STATE_FILE.unlink(missing_ok=True)
-        print("[OK] Migration state reset")
+        log.info("[OK] Migration state reset")
         return
 
     if args.status:
-        print("Migration state:")
-        print(f"  Completed steps: {state.data['completed_steps']}")
-        print(f"  Categories: {len(state.data['wp_categories'])}")
-        print(f"  Posts→Articles: {len(state.data['wp_posts'])}")
-        print(f"  Pages: {len(state.data['wp_pages'])}")
-        print(f"  WN Media: {len(state.data['wp_media_wn'])}")
-        print(f"  SI Media: {len(state.data['wp_media_si'])}")
-        print(f"  Menus: {list(state.data['si_menus'].keys())}")
-        print(f"  Contacts: {len(state.data['si_contacts'])}")
+        log.info("Migration state:")
+        log.info("  Completed steps: %s", state.data['completed_steps'])
+        log.info("  Categories: %s", len(state.data['wp_categories']))
+        log.info("  Posts→Articles: %s", len(state.data['wp_posts']))
+        log.info("  Pages: %s", len(state.data['wp_pages']))
+        log.info("  WN Media: %s", len(state.data['wp_media_wn']))
+        log.info("  SI Media: %s", len(state.data['wp_media_si']))
+        log.info("  Menus: %s", list(state.data['si_menus'].keys()))
+        log.info("  Contacts: %s", len(state.data['si_contacts']))
         return
 
-    print("=" * 60)
-    print("WordPress → Ecossistema Digital Migration")
-    print("=" * 60)
-    print(f"  WP Source:  {WP_BASE}")
-    print(f"  SI Backend: {SI_BACKEND}")
-    print(f"  WN Backend: {WN_BACKEND}")
-    print(f"  Keycloak:   {KEYCLOAK_URL}")
-    print(f"  Dry run:    {args.dry_run}")
-    print()
+    log.info("=" * 60)
+    log.info("WordPress → Ecossistema Digital Migration")
+    log.info("=" * 60)
+    log.info("  WP Source:  %s", WP_BASE)
+    log.info("  SI Backend: %s", SI_BACKEND)
+    log.info("  WN Backend: %s", WN_BACKEND)
+    log.info("  Keycloak:   %s", KEYCLOAK_URL)
+    log.info("  Dry run:    %s", args.dry_run)
+    log.info("")
 
     # Authenticate
     if args.dry_run:
         token = "dry-run-token"
-        print("[DRY] Skipping Keycloak authentication")
+        log.info("[DRY] Skipping Keycloak authentication")
     else:
         token = get_keycloak_token()
 
-    # Run steps
-    if args.step:
-        STEPS[args.step](token, state, args.dry_run)
-    else:
-        for step_name in STEP_ORDER:
-            STEPS[step_name](token, state, args.dry_run)
-
-    print("\n" + "=" * 60)
-    print("Migration complete!")
-    print("=" * 60)
-    print(f"  Categories: {len(state.data['wp_categories'])}")
-    print(f"  Articles:   {len(state.data['wp_posts'])}")
-    print(f"  Pages:      {len(state.data['wp_pages'])}")
-    print(f"  WN Media:   {len(state.data['wp_media_wn'])}")
-    print(f"  SI Media:   {len(state.data['wp_media_si'])}")
-    print(f"  Menus:      {list(state.data['si_menus'].keys())}")
-    print(f"  Contacts:   {len(state.data['si_contacts'])}")
+    # Run steps (flushing any throttled state even if a step fails)
+    try:
+        if args.step:
+            STEPS[args.step](token, state, args.dry_run)
+        else:
+            for _, run_step in STEP_PIPELINE:
+                run_step(token, state, args.dry_run)
+    finally:
+        if not args.dry_run:
+            state.save()
+
+    log.info("\n" + "=" * 60)
+    log.info("Migration complete!")
+    log.info("=" * 60)
+    log.info("  Categories: %s", len(state.data['wp_categories']))
+    log.info("  Articles:   %s", len(state.data['wp_posts']))
+    log.info("  Pages:      %s", len(state.data['wp_pages']))
+    log.info("  WN Media:   %s", len(state.data['wp_media_wn']))
+    log.info("  SI Media:   %s", len(state.data['wp_media_si']))
+    log.info("  Menus:      %s", list(state.data['si_menus'].keys()))
+    log.info("  Contacts:   %s", len(state.data['si_contacts']))
 
 
 if __name__ == "__main__":